@@ -1,11 +1,7 @@
-import pandas as pd
+import os
+import sys
 
-class DataProcessor:
-    def __init__(self, filename):
-        self.filename = filename
-        self.data = pd.read_csv(filename)
+# The shared dataprocessor package sits one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    def show_info(self):
-        print("Shape:", self.data.shape)
-        print("Columns:", list(self.data.columns))
-        print(self.data.head())
+from dataprocessor import DataProcessor
@@ -6,7 +6,7 @@ def main():
     parser.add_argument('--input', required=True)
     args = parser.parse_args()
     dp=Myprocessor(args.input)
-    dp.show_data()
+    dp.show_info()
     
 if __name__ == '__main__':
     main()
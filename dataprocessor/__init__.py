@@ -0,0 +1,1341 @@
+import importlib.util
+import io
+import os
+import pathlib
+import sys
+import pandas as pd
+import numpy as np
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from operator import eq, ge, gt, le, lt, ne
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pa_csv = None
+    pq = None
+
+# numba itself is imported lazily (see dataprocessor/numba_kernels.py)
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """
+    The numba_kernels module, or None if numba is missing or broken.
+    
+    Why: numba can be installed yet fail to import (e.g. built against
+    another NumPy); the fast paths then fall back to pandas.
+    """
+    if not HAS_NUMBA:
+        return None
+    try:
+        from . import numba_kernels
+    except ImportError:
+        return None
+    return numba_kernels
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# CSV files bigger than this are streamed in chunks instead of loaded whole
+CHUNK_THRESHOLD = 512 * 1024 * 1024
+CHUNK_SIZE = 1_000_000
+# Bytes pyarrow tokenizes per block (and per thread)
+CSV_BLOCK_SIZE = 8 << 20
+
+# Only these operators are ever spliced into a query() expression
+FILTER_OPERATORS = {'>': gt, '<': lt, '==': eq, '!=': ne, '>=': ge, '<=': le}
+
+# Frames larger than this use the Numba groupby kernel (when numba is installed
+# and there is more than one CPU). Single-threaded the kernel only ties pandas
+# (20M rows: 0.38s vs 0.44s), so it must win on parallelism to pay back the
+# ~0.4s numba import
+NUMBA_GROUPBY_MIN_ROWS = 20_000_000
+
+# Columns at least this long use the Numba summary kernel; below it the
+# kernel saves less than importing numba costs (~0.4s per process)
+NUMBA_SUMMARY_MIN_ROWS = 10_000_000
+
+# All-numeric frames with at least this many values in mostly-distinct columns
+# build clean()'s keep-mask with the Numba kernel. Below it the kernel's win
+# (e.g. 0.42s → 0.12s at 1M x 4 random floats) is less than the ~0.4s a
+# process pays for the numba import and first call
+NUMBA_CLEAN_MIN_VALUES = 5_000_000
+
+# Frames with more numeric columns than this summarize them on a thread pool
+PARALLEL_ANALYZE_MIN_COLUMNS = 20
+
+# ============================================
+# DECORATORS SECTION
+# ============================================
+
+def timer(func):
+    """
+    Decorator to measure execution time of any function.
+    
+    Line-by-line:
+    - @wraps preserves original function metadata (name, docstring)
+    - wrapper(*args, **kwargs) accepts any arguments
+    - Measures time before and after function execution
+      (perf_counter_ns: monotonic, nanosecond resolution)
+    - Returns original function result
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        elapsed_ns = time.perf_counter_ns() - start
+        print(f'⏱️  {func.__name__} took {elapsed_ns / 1e9:.4f}s')
+        return result
+    return wrapper
+
+def log_operation(func):
+    """
+    Decorator to log what operation is being performed.
+    
+    Why: Helps track what your program is doing, useful for debugging
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        print(f'📝 Starting: {func.__name__}')
+        result = func(*args, **kwargs)
+        print(f'✅ Completed: {func.__name__}')
+        return result
+    return wrapper
+
+def handle_errors(func):
+    """
+    Decorator to catch and handle errors gracefully.
+    
+    Why: Prevents program crashes, shows user-friendly error messages
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f'❌ Error in {func.__name__}: {str(e)}')
+            return None
+    return wrapper
+
+# ============================================
+# CUSTOM EXCEPTIONS
+# ============================================
+
+class DataProcessorError(Exception):
+    """Base exception for DataProcessor"""
+    pass
+
+class FileLoadError(DataProcessorError):
+    """Raised when file cannot be loaded"""
+    pass
+
+class DataCleaningError(DataProcessorError):
+    """Raised when data cleaning fails"""
+    pass
+
+# ============================================
+# ANALYSIS HELPERS
+# ============================================
+
+def _summarize_column(values):
+    """
+    describe()-style statistics for one numeric column array.
+    
+    Why a plain function: analyze() runs it on a thread pool; the numpy
+    reductions and the Numba kernel release the GIL, so columns are
+    summarized in parallel.
+    
+    Line-by-line:
+    - Work in float64, with NaN as the missing marker
+    - count/mean/std/min/max skip NaN, like pandas; for columns of
+      NUMBA_SUMMARY_MIN_ROWS or more, with numba, they come from one
+      Welford pass (summarize()) instead of five reductions
+    - Quartiles use linear interpolation (partition-based), like describe()
+    """
+    values = np.asarray(values, dtype=np.float64)
+    kernels = _numba_kernels() if len(values) >= NUMBA_SUMMARY_MIN_ROWS else None
+    if kernels is not None:
+        n, mean, std, low, high = kernels.summarize(values)
+        if n < len(values):
+            values = values[~np.isnan(values)]
+    else:
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n:
+            mean, low, high = values.mean(), values.min(), values.max()
+            std = values.std(ddof=1) if n > 1 else np.nan
+    if n == 0:
+        return {'count': 0.0, 'mean': np.nan, 'std': np.nan, 'min': np.nan,
+                '25%': np.nan, '50%': np.nan, '75%': np.nan, 'max': np.nan}
+    q25, q50, q75 = np.percentile(values, [25, 50, 75])
+    return {
+        'count': float(n),
+        'mean': float(mean),
+        'std': float(std),
+        'min': float(low),
+        '25%': float(q25),
+        '50%': float(q50),
+        '75%': float(q75),
+        'max': float(high),
+    }
+
+# ============================================
+# STREAMING HELPERS
+# ============================================
+
+class _HyperLogLog:
+    """
+    Approximate distinct-value counter with fixed memory (16 KB).
+    
+    Why: nunique() over a streamed file would otherwise need every
+    distinct value in RAM. Relative error is about 0.8%.
+    """
+    PRECISION = 14  # 2**14 registers; keeps the remaining 50 bits exact as float64
+
+    def __init__(self):
+        self.registers = np.zeros(1 << self.PRECISION, dtype=np.uint8)
+
+    def add(self, hashes):
+        """
+        Fold a uint64 hash array into the registers.
+        
+        Line-by-line:
+        - Top PRECISION bits pick the register
+        - frexp() exponent of the remaining bits is their bit length
+        - rank = leading zeros + 1, keep the max per register
+        """
+        low_bits = 64 - self.PRECISION
+        idx = (hashes >> np.uint64(low_bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << low_bits) - 1)
+        rank = (low_bits + 1) - np.frexp(rest.astype(np.float64))[1]
+        np.maximum.at(self.registers, idx, rank.astype(np.uint8))
+
+    def count(self):
+        """Return the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+def _casts(values, target):
+    """True if pc.cast() can convert every value to target."""
+    try:
+        pc.cast(values, target)
+        return True
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return False
+
+def _guess_type(column):
+    """
+    Narrowest type a block of CSV text fits: int, bool, date, timestamp, float.
+    
+    Line-by-line:
+    - Nulls ("", NA, NaN, ...) are already null; all-null → pa.null()
+    - Try each cast in pyarrow's own inference order; first success wins
+    - A failing cast costs about as much as a full scan, so candidates
+      are ruled out on the first 1024 values and only the survivor is
+      checked against the whole block
+    - Nothing fits: string
+    """
+    values = column.drop_null()
+    if len(values) == 0:
+        return pa.null()
+    sample = values.slice(0, 1024)
+    for candidate in (pa.int64(), pa.bool_(), pa.date32(), pa.timestamp('ns'), pa.float64()):
+        if _casts(sample, candidate) and _casts(values, candidate):
+            return candidate
+    return pa.string()
+
+def _widen(current, new):
+    """
+    Smallest type holding both: int+float → float, date+timestamp → timestamp,
+    anything else that disagrees → string (pandas would give object).
+    """
+    if current == new or new == pa.null():
+        return current
+    if current == pa.null():
+        return new
+    pair = {current, new}
+    if pair == {pa.int64(), pa.float64()}:
+        return pa.float64()
+    if pair == {pa.date32(), pa.timestamp('ns')}:
+        return pa.timestamp('ns')
+    return pa.string()
+
+def _infer_csv_schema(path):
+    """
+    Pick one type per column that fits every block of a CSV file.
+    
+    Why: pandas' chunked reader and pyarrow's streaming reader both infer
+    types from the first block only. A later 1.5 in an int column, or text
+    in a column that was empty so far, breaks the streamed passes.
+    
+    Line-by-line:
+    - Read every column as text (tokenizing only, no conversion)
+    - _guess_type() per block, _widen() across blocks
+    - Columns already widened to string are not guessed again
+    """
+    with pa_csv.open_csv(path) as reader:
+        names = reader.schema.names
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in names}, strings_can_be_null=True)
+    types = {name: pa.null() for name in names}
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    with pa_csv.open_csv(path, read_options=read_options,
+                         convert_options=convert_options) as reader:
+        for batch in reader:
+            for name, column in zip(names, batch.columns):
+                if types[name] != pa.string():
+                    types[name] = _widen(types[name], _guess_type(column))
+    return pa.schema([(name, types[name]) for name in names])
+
+def _merge_moments(a, b):
+    """
+    Combine two (count, mean, M2) summaries with Chan's parallel formula.
+    
+    Why not sum and sum of squares: their difference cancels when the
+    spread is small next to the mean (1e9 + N(0, 1) comes out as std 0).
+    M2 is the sum of squared deviations from the mean; var = M2 / (n - 1).
+    """
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+def _first_seen(hashes, seen):
+    """
+    Mark rows whose hash was not seen in an earlier row or chunk.
+    
+    Line-by-line:
+    - seen: Set of row hashes shared across all chunks
+    - keep[i] is True only for the first occurrence of each hash
+    """
+    keep = np.zeros(len(hashes), dtype=bool)
+    for i, h in enumerate(hashes.tolist()):
+        if h not in seen:
+            seen.add(h)
+            keep[i] = True
+    return keep
+
+# ============================================
+# MAIN DATA PROCESSOR CLASS
+# ============================================
+
+class DataProcessor:
+    """
+    Main class for processing data files.
+    
+    Attributes:
+        filepath (str): Path to the data file
+        data (pd.DataFrame): The loaded data (loaded on first use when streaming)
+        original_shape (tuple): Original data dimensions (rows, cols)
+    
+    Methods:
+        clean(): Remove duplicates and missing values
+        downcast(): Shrink column dtypes to the smallest lossless fit
+        analyze(): Generate statistical summary
+        filter_data(): Filter based on column conditions
+        group_by(): Group data by column and aggregate
+        filter_then_group(): Filter + group in one pass, data left as is
+        plot_graph(): Create visualizations
+        save_report(): Export results
+    """
+    
+    def __init__(self, filepath):
+        """
+        Initialize DataProcessor.
+        
+        Line-by-line:
+        - self.filepath: Store the file path
+        - self._source: File that streamed passes read from (the Parquet
+          cache when one is fresh)
+        - self._stream_schema: Column types for streamed CSV reads
+        - self._chunked: Stream large CSVs instead of loading them
+        - self.data: Load file into pandas DataFrame (row-major if homogeneous)
+        - self.original_shape: Remember original size before cleaning
+          (filled in by the first full pass when streaming)
+        """
+        self.filepath = filepath
+        self._source = filepath
+        self._stream_schema = None
+        self._chunked = self._should_stream()
+        if self._chunked and self._cache_path() is not None:
+            self._source = self._cache_path()
+        if self._chunked:
+            self._data = None
+            self.original_shape = None
+            print(f"📂 Streaming {filepath} in chunks of {CHUNK_SIZE:,} rows")
+        else:
+            self.data = self._row_major(self._load_file())
+            self.original_shape = self.data.shape
+            print(f"📂 Loaded {filepath}: {self.data.shape[0]} rows, {self.data.shape[1]} columns")
+
+    @property
+    def data(self):
+        """
+        The working DataFrame.
+        
+        Why a property: When streaming, operations without a chunked path
+        (filter, groupby, plot, info) load the full data on first access.
+        """
+        if self._data is None and self._chunked:
+            self._data = self._materialize()
+            self._chunked = False
+            if self.original_shape is None:
+                self.original_shape = self._data.shape
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    def _col_ndarray(self, name):
+        """
+        Return a column's underlying array straight from its block.
+        
+        Why: self.data[name] builds (and caches) a Series wrapper on every
+        access; the hot paths only need the raw values.
+        
+        Line-by-line:
+        - blknos[i]: Which block holds column i
+        - blklocs[i]: Row of that 2D block holding column i
+        - Extension blocks (e.g. strings) hold exactly one column, 1D
+        """
+        mgr = self.data._mgr
+        i = self.data.columns.get_loc(name)
+        values = mgr.blocks[mgr.blknos[i]].values
+        if values.ndim == 1:
+            return values
+        return values[mgr.blklocs[i]]
+
+    @staticmethod
+    def _null_counts(data):
+        """
+        Missing values per column, without building an isnull() frame.
+        
+        Why: isnull().sum() first materializes a boolean DataFrame the
+        size of the data; here each block is checked and summed directly.
+        
+        Line-by-line:
+        - mgr_locs: Which columns a block holds
+        - int/uint/bool blocks can't hold NaN: stay 0
+        - float blocks: np.isnan(); everything else: pd.isna()
+        - Sum along the row axis (last axis of a block)
+        """
+        counts = np.zeros(data.shape[1], dtype=np.int64)
+        for block in data._mgr.blocks:
+            values = block.values
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'iub':
+                continue
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'fc':
+                nulls = np.isnan(values)
+            else:
+                nulls = np.asarray(pd.isna(values))
+            counts[block.mgr_locs.as_array] = nulls.sum(axis=-1)
+        return pd.Series(counts, index=data.columns)
+
+    @staticmethod
+    def _row_major(data):
+        """
+        Store a single-dtype numeric frame as one row-contiguous 2D buffer.
+        
+        Why: head(), filter_data() and report serialization walk rows;
+        with rows contiguous each row is one cache-friendly read.
+        
+        Line-by-line:
+        - Only for one numpy numeric dtype (mixed frames need several blocks)
+        - ascontiguousarray(): C-order copy of the values
+        - copy=False: Keep that buffer instead of letting pandas re-copy it
+        """
+        dtypes = set(data.dtypes)
+        if len(dtypes) != 1 or data.shape[1] < 2:
+            return data
+        dtype = dtypes.pop()
+        if not isinstance(dtype, np.dtype) or not pd.api.types.is_numeric_dtype(dtype):
+            return data
+        values = np.ascontiguousarray(data.to_numpy())
+        return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+
+    def _should_stream(self):
+        """
+        Decide whether to process the file chunk by chunk.
+        
+        Why pyarrow is required: cleaned chunks are spilled to Parquet
+        """
+        return (pq is not None
+                and pathlib.Path(self.filepath).suffix.lower() == '.csv'
+                and os.path.getsize(self.filepath) > CHUNK_THRESHOLD)
+
+    def _iter_chunks(self):
+        """
+        Yield the streamed source as DataFrames of about CHUNK_SIZE rows.
+        
+        Line-by-line:
+        - CSV source: pyarrow streaming reader with one schema for the
+          whole file (inferred once by _infer_csv_schema()), same null
+          handling and date dtypes as _read_csv()
+        - Record batches are grouped until they reach CHUNK_SIZE rows
+        - Parquet source (after clean): memory-mapped record batches
+        """
+        if self._source.endswith('.parquet'):
+            parquet_file = pq.ParquetFile(self._source, memory_map=True)
+            for batch in parquet_file.iter_batches(batch_size=CHUNK_SIZE):
+                yield batch.to_pandas(date_as_object=False)
+            return
+        
+        if self._stream_schema is None:
+            self._stream_schema = _infer_csv_schema(self._source)
+        read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+        convert_options = pa_csv.ConvertOptions(
+            column_types=self._stream_schema, strings_can_be_null=True)
+        pending, rows = [], 0
+        with pa_csv.open_csv(self._source, read_options=read_options,
+                             convert_options=convert_options) as reader:
+            for batch in reader:
+                pending.append(batch)
+                rows += batch.num_rows
+                if rows >= CHUNK_SIZE:
+                    yield pa.Table.from_batches(pending).to_pandas(date_as_object=False)
+                    pending, rows = [], 0
+        if pending:
+            yield pa.Table.from_batches(pending).to_pandas(date_as_object=False)
+
+    def _materialize(self):
+        """Load the whole streamed source into memory."""
+        if self._source.endswith('.parquet'):
+            return pq.read_table(self._source, memory_map=True).to_pandas(date_as_object=False)
+        return self._read_csv()
+
+    @handle_errors
+    def _load_file(self):
+        """
+        Private method to load different file types.
+        
+        Why private (_): Internal helper method, users don't call directly
+        
+        Line-by-line:
+        - Look up the reader for the file extension (one dict lookup)
+        - CSV/Parquet go through pyarrow's column-native readers
+        - Use appropriate pandas reader for everything else
+        - Raise custom exception if unsupported
+        """
+        reader = self._READERS.get(pathlib.Path(self.filepath).suffix.lower())
+        if reader is None:
+            raise FileLoadError(f"Unsupported file type: {self.filepath}")
+        return reader(self)
+
+    def _cache_path(self):
+        """
+        Return the Parquet cache next to the source file, or None if stale.
+        
+        Why: Re-parsing the same CSV on every run is the slowest part of
+        a short CLI call; a fresh <file>.csv.parquet is memory-mapped instead.
+        
+        Line-by-line:
+        - Fresh means the size and mtime recorded in the cache's schema
+          metadata (see _source_stamp()) match the CSV exactly; a newer
+          cache is not enough, since cp -p/rsync -a/tar x keep old mtimes
+        - read_schema() only reads the Parquet footer
+        """
+        cache = self.filepath + '.parquet'
+        if pq is None or not os.path.exists(cache):
+            return None
+        metadata = pq.read_schema(cache).metadata or {}
+        stamp = self._source_stamp()
+        if all(metadata.get(key) == value for key, value in stamp.items()):
+            return cache
+        return None
+
+    def _source_stamp(self):
+        """Size and mtime of the CSV, as Parquet schema metadata for the cache."""
+        stat = os.stat(self.filepath)
+        return {b'source_size': str(stat.st_size).encode(),
+                b'source_mtime_ns': str(stat.st_mtime_ns).encode()}
+
+    def _read_csv(self):
+        """
+        Read a CSV file, preferring pyarrow's multi-threaded reader.
+        
+        Line-by-line:
+        - Fresh Parquet cache: memory-map it instead of parsing the CSV
+        - pa_csv.read_csv(): Tokenize in parallel, 8 MB blocks per thread
+        - strings_can_be_null=True: Empty text fields are NaN, like pandas
+        - pa.ArrowInvalid (e.g. a short row): pd.read_csv() pads with NaN
+        - pq.write_table(): Cache the parsed table for the next run (zstd),
+          stamped with the CSV's size and mtime
+        - to_pandas(self_destruct=True): Free Arrow buffers as columns convert
+        - split_blocks=True: One block per column, no consolidation copy
+        - date_as_object=False: Dates become datetime64, not Python objects
+        - Fall back to pd.read_csv() when pyarrow is not installed
+        """
+        if pa_csv is None:
+            return pd.read_csv(self.filepath)
+        
+        cache = self._cache_path()
+        if cache is not None:
+            table = pq.read_table(cache, memory_map=True)
+        else:
+            read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+            convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+            try:
+                table = pa_csv.read_csv(self.filepath, read_options=read_options,
+                                        convert_options=convert_options)
+            except pa.ArrowInvalid:
+                return pd.read_csv(self.filepath)
+            table = table.replace_schema_metadata(self._source_stamp())
+            try:
+                pq.write_table(table, self.filepath + '.parquet', compression='zstd')
+            except OSError as e:
+                print(f"⚠️  Could not write Parquet cache: {e}")
+        return table.to_pandas(self_destruct=True, split_blocks=True, date_as_object=False)
+
+    def _read_parquet(self):
+        """
+        Read a Parquet file with pyarrow.
+        
+        Note: Install pyarrow: pip install pyarrow
+        """
+        if pq is None:
+            raise FileLoadError("pyarrow not installed. Run: pip install pyarrow")
+        table = pq.read_table(self.filepath, memory_map=True)
+        return table.to_pandas(self_destruct=True, split_blocks=True, date_as_object=False)
+
+    # File extension → reader, used by _load_file()
+    _READERS = {
+        '.csv': _read_csv,
+        '.parquet': _read_parquet,
+        '.xlsx': lambda self: pd.read_excel(self.filepath),
+        '.xls': lambda self: pd.read_excel(self.filepath),
+        '.json': lambda self: pd.read_json(self.filepath),
+    }
+
+    @timer
+    @log_operation
+    def clean(self):
+        """
+        Clean data by removing duplicates and missing values.
+        
+        Line-by-line:
+        - Streamed files go through _clean_chunks() instead
+        - before: Store shape before cleaning
+        - Large numeric frames of mostly distinct values: Numba kernel
+          builds the keep-mask in one pass (see _numba_cleanable())
+        - na_mask: Rows without any missing values
+        - dup_mask: First occurrence of each row (like drop_duplicates())
+        - One iloc[] with both masks: a single copy instead of two rewrites
+        - after: Store shape after cleaning
+        - Calculate and print how many rows removed
+        
+        Why @timer and @log_operation: Track performance and log actions
+        """
+        if self._chunked:
+            before, after = self._clean_chunks()
+        else:
+            before = self.data.shape
+            if self._numba_cleanable():
+                keep = _numba_kernels().clean_mask(*self._row_bits())
+            else:
+                na_mask = self.data.notna().all(axis=1).to_numpy()
+                dup_mask = ~self.data.duplicated().to_numpy()
+                keep = na_mask & dup_mask
+            self.data = self.data.iloc[keep].reset_index(drop=True)
+            after = self.data.shape
+        
+        rows_removed = before[0] - after[0]
+        print(f"🧹 Cleaned: Removed {rows_removed} rows")
+        print(f"   Before: {before} → After: {after}")
+
+    @timer
+    @log_operation
+    def downcast(self):
+        """
+        Convert columns to the smallest dtype that holds them losslessly.
+        
+        Why: analyze(), group_by() and filter_data() are memory-bound
+        scans; halving element size roughly doubles their throughput.
+        
+        Line-by-line:
+        - Integers: pd.to_numeric(downcast='integer') picks int8/16/32
+        - Floats: float32 only if every value survives the round trip
+        - Text with < 50% distinct values: store as category
+        - Re-apply the row-major layout if the frame is homogeneous again
+        """
+        before = self.data.memory_usage(deep=True).sum()
+        
+        columns = {}
+        for col in self.data.columns:
+            series = self.data[col]
+            if pd.api.types.is_integer_dtype(series.dtype):
+                series = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_float_dtype(series.dtype):
+                smaller = pd.to_numeric(series, downcast='float')
+                if smaller.astype(series.dtype).equals(series):
+                    series = smaller
+            elif (pd.api.types.is_string_dtype(series.dtype)
+                    and len(series) and series.nunique() / len(series) < 0.5):
+                series = series.astype('category')
+            columns[col] = series
+        self.data = self._row_major(pd.DataFrame(columns, index=self.data.index))
+        
+        after = self.data.memory_usage(deep=True).sum()
+        print(f"🗜️  Downcast: {before:,} → {after:,} bytes")
+
+    def _numba_cleanable(self):
+        """
+        True if clean_mask() should build clean()'s keep-mask.
+        
+        Why look at cardinality: duplicated() factorizes column by column,
+        which is cheap for columns with few distinct values (3M x 16 ints
+        in 0..4: 0.76s vs 1.6s for the kernel) and slow for mostly
+        distinct ones (3M x 16 random floats: 8.2s vs 1.7s).
+        
+        Line-by-line:
+        - Every column a numpy int/uint/float column
+        - A column counts as distinct if over half of a 10k-value strided
+          sample is unique
+        - At least half the columns distinct, and rows × distinct columns
+          ≥ NUMBA_CLEAN_MIN_VALUES
+        - numba is imported last, only once everything else qualifies
+        """
+        n_rows, n_cols = self.data.shape
+        if n_cols == 0 or n_rows * n_cols < NUMBA_CLEAN_MIN_VALUES:
+            return False
+        if not all(isinstance(dtype, np.dtype) and dtype.kind in 'iuf'
+                   for dtype in self.data.dtypes):
+            return False
+        step = max(1, n_rows // 10_000)
+        distinct = 0
+        for col in self.data.columns:
+            sample = self._col_ndarray(col)[::step]
+            if len(pd.unique(sample)) * 2 > len(sample):
+                distinct += 1
+        return (distinct * 2 >= n_cols
+                and n_rows * distinct >= NUMBA_CLEAN_MIN_VALUES
+                and _numba_kernels() is not None)
+
+    def _row_bits(self):
+        """
+        Pack an all-numeric frame into a C-ordered uint64 matrix for clean_mask().
+        
+        Line-by-line:
+        - Integers: cast to int64, reinterpret as uint64 (lossless)
+        - Floats: widen to float64, + 0.0 folds -0.0 into 0.0, keep the bits
+        - column_stack(): One row per data row, rows contiguous
+        - is_float: Which columns can hold NaN
+        """
+        columns = []
+        is_float = np.zeros(self.data.shape[1], dtype=np.bool_)
+        for j, col in enumerate(self.data.columns):
+            values = self._col_ndarray(col)
+            if values.dtype.kind == 'f':
+                is_float[j] = True
+                columns.append((values.astype(np.float64) + 0.0).view(np.uint64))
+            else:
+                columns.append(values.astype(np.int64).view(np.uint64))
+        return np.column_stack(columns), is_float
+
+    def _exact_dtypes(self, chunk):
+        """
+        Map columns the stream schema reads as int64/bool to those dtypes.
+        
+        Line-by-line:
+        - No stream schema (Parquet source): nothing to restore
+        - Only columns present in this chunk are returned, for astype()
+        """
+        if self._stream_schema is None:
+            return {}
+        exact = {pa.int64(): 'int64', pa.bool_(): 'bool'}
+        return {field.name: exact[field.type] for field in self._stream_schema
+                if field.type in exact and field.name in chunk.columns}
+    
+    def _clean_chunks(self):
+        """
+        Clean a streamed file one chunk at a time.
+        
+        Returns:
+            tuple: (shape before, shape after)
+        
+        Line-by-line:
+        - dropna() each chunk (order vs. dedup does not change the result)
+        - Int/bool columns come back as float/object in chunks that had
+          nulls; cast them back so equal rows hash equal across chunks
+        - Hash each row; keep only hashes not seen in any earlier chunk
+        - Append surviving rows to <file>.clean.parquet
+        - Point later streamed passes at the memory-mapped Parquet file
+        """
+        output_file = self.filepath + '.clean.parquet'
+        seen = set()
+        rows_before = rows_after = n_cols = 0
+        writer = None
+        try:
+            for chunk in self._iter_chunks():
+                rows_before += len(chunk)
+                n_cols = chunk.shape[1]
+                chunk = chunk.dropna().astype(self._exact_dtypes(chunk))
+                hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+                chunk = chunk[_first_seen(hashes, seen)]
+                rows_after += len(chunk)
+                
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        if self.original_shape is None:
+            self.original_shape = (rows_before, n_cols)
+        self._source = output_file
+        print(f"   Cleaned rows written to: {output_file}")
+        return (rows_before, n_cols), (rows_after, n_cols)
+
+    @timer
+    @log_operation
+    def analyze(self):
+        """
+        Generate comprehensive statistical analysis.
+        
+        Returns:
+            dict: Contains shape, columns, data types, and statistics
+        
+        Line-by-line:
+        - Streamed files go through _analyze_chunks() instead
+        - _describe(): Statistics for all columns, as a dictionary for JSON export
+        - dtypes: Data types of each column
+        - Build report dictionary with all info
+        """
+        if self._chunked:
+            return self._analyze_chunks()
+        
+        stats = self._describe()
+        
+        report = {
+            'filename': self.filepath,
+            'original_shape': self.original_shape,
+            'current_shape': self.data.shape,
+            'columns': list(self.data.columns),
+            'data_types': {col: str(dtype) for col, dtype in self.data.dtypes.items()},
+            'statistics': stats,
+            'missing_values': self._null_counts(self.data).to_dict()
+        }
+        
+        print(f"📊 Analysis complete: {len(self.data.columns)} columns analyzed")
+        return report
+
+    def _describe(self):
+        """
+        Per-column statistics, equivalent to describe(include='all').
+        
+        Why not include='all': it summarizes non-numeric columns in a slow
+        per-column loop and pads every column with every statistic.
+        
+        Line-by-line:
+        - Numeric columns: _summarize_column() each (single-pass with numba)
+        - Wide frames: run those summaries on a thread pool
+        - Narrow frames below NUMBA_SUMMARY_MIN_ROWS, or without numba,
+          use one vectorized describe() call
+        - Other columns: a single value_counts() gives count/unique/top/freq
+        """
+        stats = {}
+        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) > PARALLEL_ANALYZE_MIN_COLUMNS:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                summaries = executor.map(_summarize_column, self._numeric_arrays(numeric_cols))
+                stats.update(zip(numeric_cols, summaries))
+        elif (len(numeric_cols) and len(self.data) >= NUMBA_SUMMARY_MIN_ROWS
+                and _numba_kernels() is not None):
+            summaries = map(_summarize_column, self._numeric_arrays(numeric_cols))
+            stats.update(zip(numeric_cols, summaries))
+        elif len(numeric_cols):
+            stats.update(self.data[numeric_cols].describe().to_dict())
+        
+        for col in self.data.select_dtypes(exclude=[np.number]).columns:
+            counts = self.data[col].value_counts(dropna=True)
+            counts = counts[counts > 0]  # unused categories
+            stats[col] = {
+                'count': int(counts.sum()),
+                'unique': len(counts),
+                'top': counts.index[0] if len(counts) else None,
+                'freq': int(counts.iloc[0]) if len(counts) else None,
+            }
+        
+        return {col: stats[col] for col in self.data.columns}
+
+    def _numeric_arrays(self, columns):
+        """Raw arrays for numeric columns; extension arrays as float64 with NaN."""
+        arrays = []
+        for col in columns:
+            values = self._col_ndarray(col)
+            if not isinstance(values, np.ndarray):
+                values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            arrays.append(values)
+        return arrays
+
+    def _analyze_chunks(self):
+        """
+        Build the analyze() report from online counters over a streamed file.
+        
+        Line-by-line:
+        - Numeric columns: per-chunk count/mean/M2 merged with
+          _merge_moments(), plus running min and max
+        - Every column: HyperLogLog sketch for approximate unique count
+        - Missing values: per-chunk _null_counts() added up
+        - mean/std derived at the end; quartiles/top/freq are not streamable
+        """
+        rows = 0
+        columns, dtypes, missing = [], {}, None
+        moments, low, high = {}, {}, {}
+        sketches = {}
+        
+        for chunk in self._iter_chunks():
+            if missing is None:
+                columns = list(chunk.columns)
+                dtypes = {col: str(dtype) for col, dtype in chunk.dtypes.items()}
+                missing = pd.Series(0, index=chunk.columns)
+                sketches = {col: _HyperLogLog() for col in columns}
+            rows += len(chunk)
+            missing += self._null_counts(chunk)
+            
+            for col in chunk.select_dtypes(include=[np.number]).columns:
+                values = chunk[col].dropna().to_numpy(dtype=np.float64)
+                if len(values) == 0:
+                    continue
+                mean = values.mean()
+                deviations = values - mean
+                chunk_moments = (len(values), mean, np.dot(deviations, deviations))
+                moments[col] = (_merge_moments(moments[col], chunk_moments)
+                                if col in moments else chunk_moments)
+                low[col] = min(low.get(col, np.inf), values.min())
+                high[col] = max(high.get(col, -np.inf), values.max())
+            
+            for col in columns:
+                values = chunk[col].dropna()
+                if pd.api.types.is_numeric_dtype(values.dtype):
+                    # 1 and 1.0 must land in the same register across chunks
+                    values = values.astype(np.float64)
+                hashes = pd.util.hash_pandas_object(values, index=False)
+                sketches[col].add(hashes.to_numpy())
+        
+        for col in columns:
+            # Match the whole-file dtypes: nulls anywhere widen int columns
+            if missing[col] and dtypes[col] == 'int64':
+                dtypes[col] = 'float64'
+        
+        stats = {}
+        for col in columns:
+            col_stats = {'count': int(rows - missing[col]),
+                         'unique': sketches[col].count()}
+            if col in moments:
+                n, mean, m2 = moments[col]
+                std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+                col_stats.update({'mean': mean, 'std': std,
+                                  'min': low[col], 'max': high[col]})
+            stats[col] = col_stats
+        
+        if self.original_shape is None:
+            self.original_shape = (rows, len(columns))
+        
+        report = {
+            'filename': self.filepath,
+            'original_shape': self.original_shape,
+            'current_shape': (rows, len(columns)),
+            'columns': columns,
+            'data_types': dtypes,
+            'statistics': stats,
+            'missing_values': missing.to_dict() if missing is not None else {}
+        }
+        
+        print(f"📊 Analysis complete: {len(columns)} columns analyzed (streamed)")
+        return report
+
+    @timer
+    def filter_data(self, column, operator, value):
+        """
+        Filter data based on conditions.
+        
+        Args:
+            column (str): Column name to filter
+            operator (str): Comparison operator ('>', '<', '==', '!=', '>=', '<=')
+            value: Value to compare against
+        
+        Example:
+            dp.filter_data('Sales', '>', 500)
+        
+        Line-by-line:
+        - Check if column exists
+        - Reject unknown operators (they are spliced into the expression)
+        - Categorical columns (after downcast()): compare each category
+          once and pick rows by code; missing (-1) matches only '!=',
+          like the text column it replaced
+        - query() with numexpr evaluates the comparison without
+          building an intermediate Python-level mask
+        - Fall back to comparing the raw column array when numexpr is
+          missing or cannot handle the column type (e.g. strings) or
+          name (e.g. containing a backtick)
+        - Print how many rows match
+        """
+        if column not in self.data.columns:
+            print(f"❌ Column '{column}' not found")
+            return
+        
+        if operator not in FILTER_OPERATORS:
+            print(f"❌ Invalid operator: {operator}")
+            return
+        
+        before = len(self.data)
+        
+        values = self._col_ndarray(column)
+        if isinstance(values, pd.Categorical):
+            hits = FILTER_OPERATORS[operator](values.categories.to_numpy(), value)
+            self.data = self.data[np.append(hits, operator == '!=')[values.codes]]
+        else:
+            expr = f"`{column}` {operator} @value"
+            try:
+                self.data = self.data.query(expr, engine='numexpr', local_dict={'value': value})
+            except (ImportError, SyntaxError, TypeError, ValueError, NotImplementedError):
+                mask = FILTER_OPERATORS[operator](self._col_ndarray(column), value)
+                self.data = self.data[mask]
+        
+        after = len(self.data)
+        print(f"🔍 Filter applied: {before} → {after} rows (kept {after} rows)")
+
+    @timer
+    def group_by(self, column, agg_func='mean'):
+        """
+        Group data by column and calculate aggregate.
+        
+        Args:
+            column (str): Column to group by
+            agg_func (str): Aggregation function ('mean', 'sum', 'count', 'min', 'max')
+        
+        Returns:
+            pd.DataFrame: Grouped results
+        
+        Line-by-line:
+        - Check column exists
+        - Select only numeric columns for aggregation
+        - Large frames with mean/sum/min/max use the Numba kernel
+        - Otherwise use pandas groupby() with specified aggregation
+        - Print results in readable format
+        """
+        if column not in self.data.columns:
+            print(f"❌ Column '{column}' not found")
+            return None
+        
+        # Get numeric columns only
+        numeric_cols = self.data.select_dtypes(include=[np.number]).columns.tolist()
+        
+        if self._numba_groupable(numeric_cols, agg_func):
+            result = self._group_by_numba(column, agg_func, numeric_cols)
+        elif agg_func == 'mean':
+            result = self.data.groupby(column)[numeric_cols].mean()
+        elif agg_func == 'sum':
+            result = self.data.groupby(column)[numeric_cols].sum()
+        elif agg_func == 'count':
+            result = self.data.groupby(column).size()
+        elif agg_func == 'min':
+            result = self.data.groupby(column)[numeric_cols].min()
+        elif agg_func == 'max':
+            result = self.data.groupby(column)[numeric_cols].max()
+        else:
+            print(f"❌ Invalid aggregation: {agg_func}")
+            return None
+        
+        print(f"📈 Grouped by '{column}' using {agg_func}:")
+        print(result)
+        return result
+
+    def _group_by_numba(self, column, agg_func, numeric_cols, row_filter=None):
+        """
+        Numba fast path for group_by() on numeric columns.
+        
+        Args:
+            row_filter (tuple): Optional (filter column, operator, value);
+                only matching rows are aggregated, in the same scan
+        
+        Line-by-line:
+        - factorize(sort=True): Group codes once, keys in pandas' sorted order
+        - asfortranarray(): Each column contiguous for the per-column scan
+        - sum/min/max: integer columns go through the kernel as int64, so
+          they stay exact (float64 loses digits past 2**53); float columns
+          and every mean (float in pandas too) go through as float64
+        - group_reduce(): sum/count/min/max for all groups in one pass
+        - filtered_group_reduce(): Same, skipping rows that fail the filter;
+          groups with no matching rows are dropped
+        - Empty (all-NaN) float groups become NaN; min/max keep the dtype
+        """
+        kernels = _numba_kernels()
+        
+        codes, uniques = pd.factorize(self._col_ndarray(column), sort=True)
+        if row_filter is not None:
+            filter_col, operator, value = row_filter
+            filter_values = self._col_ndarray(filter_col).astype(np.float64)
+            opcode = kernels.FILTER_OPCODES.index(operator)
+        
+        if agg_func == 'mean':
+            blocks = [(numeric_cols, np.float64)]
+        else:
+            int_cols = [col for col in numeric_cols if self.data[col].dtype.kind in 'iu']
+            float_cols = [col for col in numeric_cols if col not in int_cols]
+            blocks = [(cols, dtype) for cols, dtype in ((float_cols, np.float64), (int_cols, np.int64))
+                      if cols]
+        
+        parts = []
+        for cols, dtype in blocks:
+            if dtype is np.float64:
+                values = self.data[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                values = self.data[cols].to_numpy(dtype=np.int64)
+            values = np.asfortranarray(values)
+            if row_filter is None:
+                sums, counts, mins, maxs = kernels.group_reduce(codes, values, len(uniques))
+                keys = uniques
+            else:
+                hits, sums, counts, mins, maxs = kernels.filtered_group_reduce(
+                    codes, filter_values, opcode, float(value), values, len(uniques))
+                present = hits > 0
+                keys = uniques[present]
+                sums, counts, mins, maxs = sums[present], counts[present], mins[present], maxs[present]
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if agg_func == 'mean':
+                    out = sums / counts
+                elif agg_func == 'sum':
+                    out = sums
+                else:
+                    out = mins if agg_func == 'min' else maxs
+                    if dtype is np.float64:
+                        out = np.where(counts > 0, out, np.nan)
+            parts.append(pd.DataFrame(out, index=pd.Index(keys, name=column), columns=cols))
+        
+        result = pd.concat(parts, axis=1)[numeric_cols] if len(parts) > 1 else parts[0]
+        if agg_func in ('min', 'max'):
+            for col in numeric_cols:
+                dtype = self.data[col].dtype
+                if dtype.kind in 'iu':
+                    result[col] = result[col].astype(dtype)
+        return result
+
+    def _numba_groupable(self, numeric_cols, agg_func):
+        """
+        True if the Numba groupby kernel should handle this aggregation.
+        
+        Line-by-line:
+        - mean/sum/min/max over more than NUMBA_GROUPBY_MIN_ROWS rows, with
+          more than one CPU for the per-column prange
+        - numpy float and int columns only (nullable extension columns and
+          uint64, which int64 can't hold, stay on pandas)
+        - numba is imported last, only once everything else qualifies
+        """
+        if (not numeric_cols
+                or len(self.data) <= NUMBA_GROUPBY_MIN_ROWS
+                or agg_func not in ('mean', 'sum', 'min', 'max')
+                or (os.cpu_count() or 1) < 2):
+            return False
+        for col in numeric_cols:
+            dtype = self.data[col].dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'iuf':
+                return False
+            if dtype.kind == 'u' and dtype.itemsize == 8:
+                return False
+        return _numba_kernels() is not None
+
+    @timer
+    def filter_then_group(self, filter_col, operator, value, group_col, agg_func='mean'):
+        """
+        Group the rows matching a filter, without filtering self.data.
+        
+        Args:
+            filter_col, operator, value: As in filter_data()
+            group_col, agg_func: As in group_by()
+        
+        Returns:
+            pd.DataFrame: Grouped results of the filtered rows
+        
+        Line-by-line:
+        - Large numeric cases: one Numba scan evaluates the filter and
+          aggregates together, so no filtered frame is ever built
+        - Otherwise: filter_data() then group_by(), and put the original
+          data back afterwards
+        """
+        for col in (filter_col, group_col):
+            if col not in self.data.columns:
+                print(f"❌ Column '{col}' not found")
+                return None
+        
+        if operator not in FILTER_OPERATORS:
+            print(f"❌ Invalid operator: {operator}")
+            return None
+        
+        numeric_cols = self.data.select_dtypes(include=[np.number]).columns.tolist()
+        filter_dtype = self.data[filter_col].dtype
+        if (isinstance(filter_dtype, np.dtype) and filter_dtype.kind in 'iuf'
+                and isinstance(value, (int, float)) and not isinstance(value, bool)
+                and self._numba_groupable(numeric_cols, agg_func)):
+            result = self._group_by_numba(group_col, agg_func, numeric_cols,
+                                          row_filter=(filter_col, operator, value))
+            print(f"📈 Rows with {filter_col} {operator} {value}, grouped by '{group_col}' using {agg_func}:")
+            print(result)
+            return result
+        
+        original = self.data
+        try:
+            self.filter_data(filter_col, operator, value)
+            return self.group_by(group_col, agg_func)
+        finally:
+            self.data = original
+
+    @handle_errors
+    def plot_graph(self, x_col, y_col, kind='line'):
+        """
+        Create visualizations (requires matplotlib).
+        
+        Args:
+            x_col (str): X-axis column
+            y_col (str): Y-axis column
+            kind (str): Chart type ('line', 'bar', 'scatter', 'hist')
+        
+        Note: Install matplotlib: pip install matplotlib
+        
+        Line-by-line:
+        - Import matplotlib (lazy import)
+        - Check columns exist
+        - Use pandas plot() method with specified kind
+        - Set labels and title
+        - Display the plot
+        """
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            print("❌ matplotlib not installed. Run: pip install matplotlib")
+            return
+        
+        if x_col not in self.data.columns or y_col not in self.data.columns:
+            print(f"❌ One or both columns not found")
+            return
+        
+        self.data.plot(x=x_col, y=y_col, kind=kind, figsize=(10, 6))
+        plt.title(f'{y_col} vs {x_col}')
+        plt.xlabel(x_col)
+        plt.ylabel(y_col)
+        plt.tight_layout()
+        plt.savefig(f'plot_{x_col}_{y_col}.png')
+        print(f"📊 Plot saved as: plot_{x_col}_{y_col}.png")
+        plt.show()
+
+    def save_report(self, report, output_file):
+        """
+        Save analysis report to file.
+        
+        Args:
+            report (dict): Report data from analyze()
+            output_file (str): Output filename
+        
+        Line-by-line:
+        - Check file extension
+        - For JSON: orjson (Rust, understands numpy scalars) with indent,
+          or json.dump() when orjson is not installed
+        - For CSV: convert dict to DataFrame, write it with pyarrow's C
+          writer (pandas to_csv() when pyarrow is not installed)
+        - Print confirmation message
+        """
+        if output_file.endswith('.json'):
+            if orjson is not None:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(report, default=str, option=options))
+            else:
+                import json
+                with open(output_file, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
+            print(f"💾 Report saved to: {output_file}")
+        elif output_file.endswith('.csv'):
+            # Convert statistics to DataFrame for CSV export
+            stats_df = pd.DataFrame(report['statistics'])
+            if pa_csv is not None:
+                # Arrow columns hold one type: mixed columns (count + top) become text
+                for col in stats_df.columns:
+                    if stats_df[col].dtype == object:
+                        stats_df[col] = stats_df[col].map(lambda v: None if pd.isna(v) else str(v))
+                table = pa.Table.from_pandas(stats_df.rename_axis('').reset_index(),
+                                             preserve_index=False)
+                pa_csv.write_csv(table, output_file)
+            else:
+                stats_df.to_csv(output_file)
+            print(f"💾 Statistics saved to: {output_file}")
+        else:
+            print(f"❌ Unsupported output format. Use .json or .csv")
+
+    def show_info(self):
+        """
+        Display quick overview of current data.
+        
+        Line-by-line:
+        - Streaming: _overview_chunks() instead of loading the file
+        - Collect basic info (shape, columns, types) in one buffer
+        - Show first 5 rows using head(), rendered straight into the buffer
+        - Display missing value counts
+        - One sys.stdout.write() instead of a print() per line
+        """
+        if self._chunked and self._data is None:
+            shape, dtypes, missing, head = self._overview_chunks()
+        else:
+            shape, dtypes = self.data.shape, self.data.dtypes
+            missing, head = self._null_counts(self.data), self.data.head()
+        
+        out = io.StringIO()
+        out.write("\n" + "="*50 + "\n")
+        out.write(f"📋 DATA OVERVIEW: {self.filepath}\n")
+        out.write("="*50 + "\n")
+        out.write(f"Shape: {shape}\n")
+        out.write(f"Columns: {list(dtypes.index)}\n")
+        out.write(f"\nData Types:\n{dtypes}\n")
+        out.write(f"\nMissing Values:\n{missing}\n")
+        out.write("\nFirst 5 rows:\n")
+        head.to_string(buf=out)
+        out.write("\n" + "="*50 + "\n\n")
+        sys.stdout.write(out.getvalue())
+    
+    def _overview_chunks(self):
+        """
+        Gather show_info()'s overview in one pass over a streamed file.
+        
+        Returns:
+            tuple: (shape, dtypes, missing value counts, first 5 rows)
+        
+        Line-by-line:
+        - First chunk: head() and dtypes
+        - Every chunk: row count and _null_counts() added up
+        - Int columns with nulls in any chunk are reported as float64,
+          as a whole-file read would load them
+        """
+        rows, dtypes, missing, head = 0, None, None, None
+        for chunk in self._iter_chunks():
+            if head is None:
+                head = chunk.head()
+                dtypes = chunk.dtypes.copy()
+                missing = pd.Series(0, index=chunk.columns)
+            rows += len(chunk)
+            missing += self._null_counts(chunk)
+        
+        widened = (missing > 0) & (dtypes == np.dtype('int64'))
+        dtypes[widened] = np.dtype('float64')
+        shape = (rows, len(dtypes))
+        if self.original_shape is None:
+            self.original_shape = shape
+        return shape, dtypes, missing, head
@@ -0,0 +1,181 @@
+"""
+Numba kernels used by DataProcessor.
+
+Kept in their own module so numba is only imported when a fast path
+actually runs; importing it costs more than the rest of CLI startup.
+"""
+import numba as nb
+import numpy as np
+
+@nb.njit(parallel=True, cache=True)
+def group_reduce(codes, values, n_groups):
+    """
+    One pass per column accumulating sum/count/min/max for every group.
+
+    Line-by-line:
+    - codes[i]: Group number of row i (-1 for a missing key)
+    - values: float64 or int64; sums/mins/maxs keep that dtype, so
+      integer columns are added and compared exactly
+    - prange over columns: Each thread owns one column of the output
+    - NaN values are skipped (x != x), like pandas' skipna
+    - mins/maxs start from each group's first value (no dtype sentinel)
+    """
+    n_rows, n_cols = values.shape
+    sums = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    counts = np.zeros((n_groups, n_cols), dtype=np.int64)
+    mins = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    maxs = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    for j in nb.prange(n_cols):
+        for i in range(n_rows):
+            g = codes[i]
+            x = values[i, j]
+            if g < 0 or x != x:
+                continue
+            sums[g, j] += x
+            if counts[g, j] == 0 or x < mins[g, j]:
+                mins[g, j] = x
+            if counts[g, j] == 0 or x > maxs[g, j]:
+                maxs[g, j] = x
+            counts[g, j] += 1
+    return sums, counts, mins, maxs
+
+@nb.njit(cache=True)
+def _mix(z):
+    """splitmix64 finalizer: every input bit affects every output bit."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+@nb.njit(cache=True)
+def _rows_equal(bits, a, b):
+    for j in range(bits.shape[1]):
+        if bits[a, j] != bits[b, j]:
+            return False
+    return True
+
+@nb.njit(parallel=True, cache=True)
+def clean_mask(bits, is_float):
+    """
+    Keep-mask for rows that have no NaN and are not an earlier row's duplicate.
+
+    Line-by-line:
+    - bits: uint64 view of every value (floats by bit pattern)
+    - prange pass: NaN check + row hash, each word folded in with _mix()
+      (a plain multiply leaves the low bits blind to exponent/mantissa,
+      so similar float rows would pile into the same slots)
+    - serial pass: open-addressing table of first occurrences sized to a
+      power of two ≥ 2 × rows; equal hashes are confirmed by comparing
+      the rows, collisions probe the next slot
+    """
+    n_rows, n_cols = bits.shape
+    hashes = np.empty(n_rows, dtype=np.uint64)
+    valid = np.ones(n_rows, dtype=np.bool_)
+    for i in nb.prange(n_rows):
+        h = np.uint64(0x9E3779B97F4A7C15)
+        for j in range(n_cols):
+            b = bits[i, j]
+            if (is_float[j] and (b >> np.uint64(52)) & np.uint64(0x7FF) == np.uint64(0x7FF)
+                    and b & np.uint64(0xFFFFFFFFFFFFF) != np.uint64(0)):
+                valid[i] = False
+            h = _mix(h ^ b)
+        hashes[i] = h
+
+    size = 1
+    while size < 2 * n_rows:
+        size *= 2
+    slot_mask = np.uint64(size - 1)
+    table = np.full(size, -1, dtype=np.int64)
+    keep = np.zeros(n_rows, dtype=np.bool_)
+    for i in range(n_rows):
+        if not valid[i]:
+            continue
+        slot = hashes[i] & slot_mask
+        while True:
+            first = table[slot]
+            if first < 0:
+                table[slot] = i
+                keep[i] = True
+                break
+            if hashes[first] == hashes[i] and _rows_equal(bits, first, i):
+                break
+            slot = (slot + np.uint64(1)) & slot_mask
+    return keep
+
+@nb.njit(nogil=True, cache=True)
+def summarize(values):
+    """
+    Welford's single pass over a float64 column: count, mean, std, min, max.
+
+    Line-by-line:
+    - NaN values are skipped, like pandas
+    - delta/m2: Running variance without a second pass over the data
+    - nogil: analyze() can run several columns on a thread pool
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for x in values:
+        if np.isnan(x):
+            continue
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return n, mean, std, lo, hi
+
+# Operator codes for filtered_group_reduce(), indexed by FILTER_OPCODES.index(op)
+FILTER_OPCODES = ('>', '<', '==', '!=', '>=', '<=')
+
+@nb.njit(cache=True)
+def _passes(x, op, threshold):
+    if op == 0:
+        return x > threshold
+    if op == 1:
+        return x < threshold
+    if op == 2:
+        return x == threshold
+    if op == 3:
+        return x != threshold
+    if op == 4:
+        return x >= threshold
+    return x <= threshold
+
+@nb.njit(parallel=True, cache=True)
+def filtered_group_reduce(codes, filter_values, op, threshold, values, n_groups):
+    """
+    group_reduce() over only the rows where filter_values <op> threshold.
+
+    Line-by-line:
+    - The filter is evaluated inside the scan; no filtered copy is made
+    - hits[g]: Rows of group g that pass the filter (0 → group dropped)
+    - prange over columns, dtypes and NaN handling as in group_reduce()
+    """
+    n_rows, n_cols = values.shape
+    hits = np.zeros(n_groups, dtype=np.int64)
+    for i in range(n_rows):
+        if codes[i] >= 0 and _passes(filter_values[i], op, threshold):
+            hits[codes[i]] += 1
+    sums = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    counts = np.zeros((n_groups, n_cols), dtype=np.int64)
+    mins = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    maxs = np.zeros((n_groups, n_cols), dtype=values.dtype)
+    for j in nb.prange(n_cols):
+        for i in range(n_rows):
+            g = codes[i]
+            x = values[i, j]
+            if g < 0 or x != x or not _passes(filter_values[i], op, threshold):
+                continue
+            sums[g, j] += x
+            if counts[g, j] == 0 or x < mins[g, j]:
+                mins[g, j] = x
+            if counts[g, j] == 0 or x > maxs[g, j]:
+                maxs[g, j] = x
+            counts[g, j] += 1
+    return hits, sums, counts, mins, maxs
@@ -0,0 +1,244 @@
+import pathlib
+
+import polars as pl
+import polars.selectors as cs
+
+from . import (
+    FILTER_OPERATORS,
+    DataProcessor,
+    log_operation,
+    timer,
+)
+
+# Same tokens pyarrow.csv reads as null in DataProcessor._read_csv()
+CSV_NULL_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                   '1.#IND', '1.#QNAN', 'N/A', 'NA', 'NULL', 'NaN', 'n/a', 'nan', 'null']
+
+# Temporary name for the group key inside group_by() plans
+GROUP_KEY = '__group_key__'
+
+# ============================================
+# POLARS-BACKED DATA PROCESSOR
+# ============================================
+
+class PolarsDataProcessor(DataProcessor):
+    """
+    DataProcessor that runs clean/filter/groupby on a polars LazyFrame.
+
+    Why: polars executes the whole chain in parallel on Arrow memory;
+    nothing is computed until a result is actually needed.
+
+    Attributes:
+        lazy (pl.LazyFrame): The pending query plan
+        data (pd.DataFrame): Pandas view of the plan, collected on first
+            access (show_info, analyze, save_report, plot_graph)
+
+    Note: Install polars: pip install polars
+    """
+
+    def __init__(self, filepath):
+        """
+        Initialize PolarsDataProcessor.
+
+        Line-by-line:
+        - self.lazy: Scan the file lazily (no rows read yet)
+        - self._data: No pandas view until someone asks for it
+        - self.original_shape: Row count via one pl.len() query
+        """
+        self.filepath = filepath
+        self._chunked = False
+        self._data = None
+        self.lazy = self._scan()
+        rows = self.lazy.select(pl.len()).collect().item()
+        self.original_shape = (rows, len(self.lazy.collect_schema()))
+        print(f"📂 Scanned {filepath}: {rows} rows, {self.original_shape[1]} columns (polars)")
+
+    def _scan(self):
+        """
+        Build a LazyFrame for the input file.
+
+        Line-by-line:
+        - CSV/Parquet: polars' native lazy scanners
+        - null_values: NA, NaN, ... are missing, as in the pandas engine
+          (without it a column containing NA is read as text)
+        - try_parse_dates: Date columns load as dates, not text, like pyarrow
+        - Anything else: load with the pandas readers, then hand to polars
+        """
+        suffix = pathlib.Path(self.filepath).suffix.lower()
+        if suffix == '.csv':
+            return pl.scan_csv(self.filepath, null_values=CSV_NULL_VALUES, try_parse_dates=True)
+        if suffix == '.parquet':
+            return pl.scan_parquet(self.filepath)
+        return pl.from_pandas(self._load_file()).lazy()
+
+    @property
+    def data(self):
+        """Pandas view of the current plan, collected once and then cached."""
+        if self._data is None:
+            self._data = self.lazy.collect().to_pandas()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        # Pandas-side edits (e.g. downcast()) become the new plan's source
+        self._data = value
+        self.lazy = pl.from_pandas(value).lazy()
+
+    def _columns(self):
+        return self.lazy.collect_schema()
+
+    @timer
+    @log_operation
+    def clean(self):
+        """
+        Queue duplicate and null removal on the lazy plan.
+
+        Line-by-line:
+        - unique(keep='first', maintain_order=True): Like drop_duplicates()
+        - fill_nan(None) on float columns: polars keeps NaN apart from
+          null, pandas' dropna() treats both as missing
+        - drop_nulls(): Like dropna()
+        - Drop the cached pandas view; it no longer matches the plan
+        """
+        self.lazy = (self.lazy
+                     .unique(keep='first', maintain_order=True)
+                     .with_columns(cs.float().fill_nan(None))
+                     .drop_nulls())
+        self._data = None
+        print("🧹 Clean queued (runs when results are needed)")
+
+    @timer
+    def filter_data(self, column, operator, value):
+        """
+        Queue a filter on the lazy plan.
+
+        Args:
+            column (str): Column name to filter
+            operator (str): Comparison operator ('>', '<', '==', '!=', '>=', '<=')
+            value: Value to compare against
+
+        Line-by-line:
+        - Check column and operator
+        - _filter_expr() builds the polars expression
+        """
+        if column not in self._columns():
+            print(f"❌ Column '{column}' not found")
+            return
+
+        if operator not in FILTER_OPERATORS:
+            print(f"❌ Invalid operator: {operator}")
+            return
+
+        self.lazy = self.lazy.filter(self._filter_expr(column, operator, value))
+        self._data = None
+        print(f"🔍 Filter queued: {column} {operator} {value}")
+
+    def _filter_expr(self, column, operator, value):
+        """
+        Polars expression for column <operator> value, with pandas' NaN rules.
+
+        Line-by-line:
+        - FILTER_OPERATORS[operator](pl.col(...), value): pl.Expr overloads
+          the comparison operators
+        - fill_nan(None) on float columns: polars orders NaN above every
+          number, pandas compares it as False
+        - '!=' → ne_missing(): pandas keeps missing rows (NaN != x is True);
+          a plain comparison would be null and filter() would drop them
+        """
+        expr = pl.col(column)
+        if self._columns()[column].is_float():
+            expr = expr.fill_nan(None)
+        if operator == '!=':
+            return expr.ne_missing(value)
+        return FILTER_OPERATORS[operator](expr, value)
+
+    @timer
+    def group_by(self, column, agg_func='mean'):
+        """
+        Group the lazy plan by column and aggregate (collects the result).
+
+        Args:
+            column (str): Column to group by
+            agg_func (str): Aggregation function ('mean', 'sum', 'count', 'min', 'max')
+
+        Returns:
+            pd.DataFrame: Grouped results (pd.Series for 'count')
+
+        Line-by-line:
+        - Check the column, then let _aggregate() run the plan
+        """
+        if column not in self._columns():
+            print(f"❌ Column '{column}' not found")
+            return None
+
+        result = self._aggregate(self.lazy, column, agg_func)
+        if result is not None:
+            print(f"📈 Grouped by '{column}' using {agg_func}:")
+            print(result)
+        return result
+
+    @timer
+    def filter_then_group(self, filter_col, operator, value, group_col, agg_func='mean'):
+        """
+        Group the rows matching a filter, without filtering self.lazy.
+
+        Args:
+            filter_col, operator, value: As in filter_data()
+            group_col, agg_func: As in group_by()
+
+        Returns:
+            pd.DataFrame: Grouped results of the filtered rows
+
+        Line-by-line:
+        - Check columns and operator
+        - lazy.filter(...) feeds _aggregate() directly: polars runs filter
+          and group_by as one plan; self.lazy and the pandas view stay untouched
+        """
+        schema = self._columns()
+        for col in (filter_col, group_col):
+            if col not in schema:
+                print(f"❌ Column '{col}' not found")
+                return None
+
+        if operator not in FILTER_OPERATORS:
+            print(f"❌ Invalid operator: {operator}")
+            return None
+
+        filtered = self.lazy.filter(self._filter_expr(filter_col, operator, value))
+        result = self._aggregate(filtered, group_col, agg_func)
+        if result is not None:
+            print(f"📈 Rows with {filter_col} {operator} {value}, grouped by '{group_col}' using {agg_func}:")
+            print(result)
+        return result
+
+    def _aggregate(self, lazy, column, agg_func):
+        """
+        Group a LazyFrame by column and collect it like pandas groupby().
+
+        Line-by-line:
+        - Numeric columns come from the schema (a numeric key included,
+          as in pandas)
+        - drop_nulls(column): pandas groupby() drops missing keys
+        - The key is grouped under GROUP_KEY so a numeric key column can
+          also be aggregated without a name clash
+        - count → pl.len(); others → pl.col(...).<agg_func>()
+        - Sort by key and collect to pandas, indexed like pandas groupby()
+        """
+        numeric_cols = [name for name, dtype in lazy.collect_schema().items()
+                        if dtype.is_numeric()]
+
+        if agg_func == 'count':
+            agg = pl.len().alias('count')
+        elif agg_func in ('mean', 'sum', 'min', 'max'):
+            agg = getattr(pl.col(numeric_cols), agg_func)()
+        else:
+            print(f"❌ Invalid aggregation: {agg_func}")
+            return None
+
+        grouped = (lazy.drop_nulls(column)
+                   .group_by(pl.col(column).alias(GROUP_KEY)).agg(agg)
+                   .sort(GROUP_KEY).collect())
+        result = grouped.to_pandas().set_index(GROUP_KEY).rename_axis(column)
+        if agg_func == 'count':
+            result = result['count'].rename(None)
+        return result
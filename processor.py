@@ -1,5 +1,5 @@
 import argparse
-from processor import DataProcessor
+from dataprocessor import DataProcessor
 
 def main():
     """
@@ -24,13 +24,17 @@ Examples:
     )
     
     # Input/Output arguments
-    parser.add_argument('--input', required=True, help="Input data file (CSV/Excel/JSON)")
+    parser.add_argument('--input', required=True, help="Input data file (CSV/Excel/JSON/Parquet)")
     parser.add_argument('--output', help="Output file for report (JSON/CSV)")
     
     # Processing operations
     parser.add_argument('--clean', action='store_true', help="Clean data (remove duplicates/nulls)")
     parser.add_argument('--analyze', action='store_true', help="Analyze and generate statistics")
     parser.add_argument('--info', action='store_true', help="Show data overview")
+    parser.add_argument('--downcast', action='store_true',
+                        help="Shrink dtypes (smaller ints/floats, category text) before processing")
+    parser.add_argument('--engine', default='pandas', choices=['pandas', 'polars'],
+                        help="Processing engine (default: pandas; polars runs lazily)")
     
     # Advanced features
     parser.add_argument('--filter', nargs=3, metavar=('COLUMN', 'OPERATOR', 'VALUE'),
@@ -46,7 +50,13 @@ Examples:
     args = parser.parse_args()
     
     # Create processor instance
-    dp = DataProcessor(args.input)
+    if args.engine == 'polars':
+        from dataprocessor.polars_engine import PolarsDataProcessor
+        dp = PolarsDataProcessor(args.input)
+    else:
+        dp = DataProcessor(args.input)
+    if args.downcast:
+        dp.downcast()
     dp.show_info()
     
     # Execute operations in logical order
@@ -63,11 +73,18 @@ Examples:
             val = float(val)
         except ValueError:
             pass  # Keep as string
-        dp.filter_data(col, op, val)
+        args.filter = (col, op, val)
     
-    if args.groupby:
-        col, func = args.groupby
-        dp.group_by(col, func)
+    # Nothing after the groupby needs the filtered rows: fuse the two
+    if args.filter and args.groupby and not (args.analyze or args.plot):
+        dp.filter_then_group(*args.filter, *args.groupby)
+    else:
+        if args.filter:
+            dp.filter_data(*args.filter)
+        
+        if args.groupby:
+            col, func = args.groupby
+            dp.group_by(col, func)
     
     if args.analyze:
         report = dp.analyze()
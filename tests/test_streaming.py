@@ -0,0 +1,156 @@
+"""
+Streamed (chunked) processing checked against the whole-file path.
+
+The chunked code only runs for CSVs over CHUNK_THRESHOLD (512 MB), so
+these tests patch the threshold, chunk size and pyarrow block size down
+and run a small file through both paths.
+
+Run: python -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import dataprocessor
+from dataprocessor import DataProcessor
+
+ROWS = 3000
+
+
+def _write_sample(path):
+    """
+    CSV whose types can only be settled by reading every block.
+
+    - Quantity: ints, with a 1.5 near the end (→ float)
+    - Note: empty until near the end, then text (→ string)
+    - Sales: some missing values
+    - Level: 1e9 + N(0, 1), where sum/sum-of-squares variance cancels
+    - The first 50 rows are repeated at the end (duplicates across chunks)
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=ROWS, freq='h').strftime('%Y-%m-%d'),
+        'Product': rng.choice(['Laptop', 'Phone', 'Tablet'], ROWS),
+        'Quantity': rng.integers(1, 10, ROWS).astype(object),
+        'Sales': rng.integers(100, 1000, ROWS).astype(float),
+        'Level': 1e9 + rng.standard_normal(ROWS),
+        'Note': [None] * ROWS,
+    })
+    df.loc[ROWS - 10, 'Quantity'] = 1.5
+    df.loc[ROWS - 20:, 'Note'] = 'late'
+    df.loc[::97, 'Sales'] = np.nan
+    df = pd.concat([df, df.iloc[ROWS - 50:]], ignore_index=True)
+    df.to_csv(path, index=False)
+
+
+class StreamingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.csv = os.path.join(self.tmp, 'sample.csv')
+        _write_sample(self.csv)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _copy(self, name):
+        """Fresh copy of the sample, so no Parquet cache is shared between runs."""
+        path = os.path.join(self.tmp, name)
+        shutil.copy(self.csv, path)
+        return path
+
+    def _whole(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return DataProcessor(self._copy('whole.csv'))
+
+    def _streamed(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            dp = DataProcessor(self._copy('streamed.csv'))
+        self.assertTrue(dp._chunked)
+        return dp
+
+    def _patched(self):
+        """Stream everything, in chunks of 400 rows read from 4 KB blocks."""
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(dataprocessor, 'CHUNK_THRESHOLD', 0))
+        stack.enter_context(mock.patch.object(dataprocessor, 'CHUNK_SIZE', 400))
+        stack.enter_context(mock.patch.object(dataprocessor, 'CSV_BLOCK_SIZE', 4096))
+        stack.enter_context(mock.patch.object(
+            DataProcessor, '_materialize', side_effect=AssertionError('file was loaded whole')))
+        return stack
+
+    def test_schema_widens_across_blocks(self):
+        with mock.patch.object(dataprocessor, 'CSV_BLOCK_SIZE', 4096):
+            schema = dataprocessor._infer_csv_schema(self.csv)
+        self.assertEqual(schema.field('Date').type, pa.date32())
+        self.assertEqual(schema.field('Product').type, pa.string())
+        self.assertEqual(schema.field('Quantity').type, pa.float64())
+        self.assertEqual(schema.field('Sales').type, pa.float64())
+        self.assertEqual(schema.field('Note').type, pa.string())
+
+    def test_show_info_matches_whole_file(self):
+        whole = self._whole()
+        with self._patched():
+            streamed = self._streamed()
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                streamed.show_info()
+        expected = io.StringIO()
+        with contextlib.redirect_stdout(expected):
+            whole.show_info()
+        self.assertEqual(out.getvalue().replace('streamed.csv', 'whole.csv'),
+                         expected.getvalue())
+
+    def test_clean_matches_whole_file(self):
+        whole = self._whole()
+        with contextlib.redirect_stdout(io.StringIO()):
+            whole.clean()
+        with self._patched(), contextlib.redirect_stdout(io.StringIO()):
+            streamed = self._streamed()
+            streamed.clean()
+        self.assertTrue(streamed._source.endswith('.clean.parquet'))
+        cleaned = streamed.data  # loads the cleaned Parquet file
+        pd.testing.assert_frame_equal(cleaned, whole.data)
+
+    def test_analyze_matches_whole_file(self):
+        whole = self._whole()
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = whole.analyze()
+        with self._patched(), contextlib.redirect_stdout(io.StringIO()):
+            report = self._streamed().analyze()
+
+        self.assertEqual(report['current_shape'], expected['current_shape'])
+        self.assertEqual(report['columns'], expected['columns'])
+        self.assertEqual(report['data_types'], expected['data_types'])
+        self.assertEqual(report['missing_values'], expected['missing_values'])
+        numeric = whole.data.select_dtypes(include=[np.number]).columns
+        for col, stats in report['statistics'].items():
+            want = expected['statistics'][col]
+            self.assertEqual(stats['count'], want['count'], col)
+            if col not in numeric:
+                continue
+            for key in ('mean', 'std', 'min', 'max'):
+                self.assertAlmostEqual(stats[key], want[key], delta=1e-7 * abs(want[key]),
+                                       msg=f"{col} {key}")
+        # HyperLogLog is approximate (~0.8% relative error)
+        unique = whole.data['Level'].nunique()
+        self.assertAlmostEqual(report['statistics']['Level']['unique'], unique,
+                               delta=0.03 * unique)
+
+    def test_std_survives_a_large_mean(self):
+        with self._patched(), contextlib.redirect_stdout(io.StringIO()):
+            report = self._streamed().analyze()
+        level = pd.read_csv(self.csv)['Level']
+        self.assertAlmostEqual(report['statistics']['Level']['std'], level.std(), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()